@@ -0,0 +1,217 @@
+import json
+import os
+from collections import Counter
+import numpy as np
+
+DAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
+SLOTS_PER_DAY = 8
+TOTAL_SLOTS = 48  # 6 days * 8 periods
+
+PERCENTILES = [10, 50, 90]
+
+
+def course_occupancy(courses, assignment):
+    """
+    Build the courses x slots occupancy matrix from a solver assignment.
+    assignment maps course_id to {"slots": [...], "room": room_id}; lab
+    slots are start slots and also occupy the following period.
+    Slots outside the week and lab periods spilling past Period 8 into the
+    next day are left out and counted instead.
+    Returns the matrix and the counts as a dict.
+    """
+    index = {row["course_id"]: i for i, row in enumerate(courses)}
+    rows, cols = [], []
+    invalid = {"out_of_range_slots": 0, "lab_day_spills": 0}
+
+    for row in courses:
+        cid = row["course_id"]
+        if cid not in assignment:
+            continue
+        slots = [slot for slot in assignment[cid]["slots"] if 0 <= slot < TOTAL_SLOTS]
+        invalid["out_of_range_slots"] += len(assignment[cid]["slots"]) - len(slots)
+        if row["type"] == "lab":
+            # The second period must be on the same day as the start
+            second = [
+                slot + 1 for slot in slots
+                if slot % SLOTS_PER_DAY != SLOTS_PER_DAY - 1
+            ]
+            invalid["lab_day_spills"] += len(slots) - len(second)
+            slots += second
+        rows += [index[cid]] * len(slots)
+        cols += slots
+
+    occupancy = np.zeros((len(courses), TOTAL_SLOTS), dtype=np.int32)
+    if rows:
+        np.add.at(occupancy, (rows, cols), 1)
+    return occupancy, invalid
+
+
+def group_cohorts(students):
+    """
+    Group students with identical registrations into cohorts.
+    Returns the cohort course lists and their sizes.
+    """
+    counts = Counter(tuple(sorted(set(row["courses"]))) for row in students)
+    cohorts = sorted(counts)
+    return cohorts, np.array([counts[c] for c in cohorts], dtype=np.int64)
+
+
+def scatter(pairs, num_rows, occupancy):
+    """
+    Sum course occupancy rows into a num_rows x slots matrix, adding
+    occupancy[course] to out[row] for each (row, course) pair.
+    """
+    out = np.zeros((num_rows, occupancy.shape[1]), dtype=occupancy.dtype)
+    if pairs:
+        rows, cols = np.array(pairs, dtype=np.int64).T
+        np.add.at(out, rows, occupancy[cols])
+    return out
+
+
+def occupancy_matrices(courses, faculty, students, rooms, assignment):
+    """
+    Build the dense slot-occupancy matrices used by every metric:
+    cohorts x slots, faculty x slots and rooms x slots, each holding the
+    number of courses scheduled for that row in that slot, plus the
+    counts of invalid slots and unknown references left out of them.
+    """
+    course_index = {row["course_id"]: i for i, row in enumerate(courses)}
+    faculty_index = {row["faculty_id"]: i for i, row in enumerate(faculty)}
+    room_index = {row["room_id"]: i for i, row in enumerate(rooms)}
+    occupancy, invalid = course_occupancy(courses, assignment)
+
+    # Courses each cohort attends, each faculty teaches and each room hosts
+    cohorts, sizes = group_cohorts(students)
+    enrolment = [
+        (g, course_index[cid]) for g, cohort in enumerate(cohorts)
+        for cid in cohort if cid in course_index
+    ]
+    teaching = [
+        (faculty_index[row["faculty_id"]], i) for i, row in enumerate(courses)
+        if row["faculty_id"] in faculty_index
+    ]
+    hosted = [
+        (assignment[row["course_id"]]["room"], i)
+        for i, row in enumerate(courses) if row["course_id"] in assignment
+    ]
+    hosting = [(room_index[rid], i) for rid, i in hosted if rid in room_index]
+
+    # References to unknown rows are left out of the matrices and counted
+    unknown = {
+        "courses": sum(len(cohort) for cohort in cohorts) - len(enrolment),
+        "faculty": len(courses) - len(teaching),
+        "rooms": len(hosted) - len(hosting),
+    }
+
+    return {
+        "cohorts": scatter(enrolment, len(cohorts), occupancy),
+        "cohort_sizes": sizes,
+        "faculty": scatter(teaching, len(faculty), occupancy),
+        "rooms": scatter(hosting, len(rooms), occupancy),
+        "invalid_slots": invalid,
+        "unknown_references": unknown,
+    }
+
+
+def by_day(matrix):
+    """Reshape a rows x slots matrix to rows x days x periods booleans"""
+    return matrix.reshape(len(matrix), len(DAYS), SLOTS_PER_DAY) > 0
+
+
+def idle_gaps(busy):
+    """Free periods between the first and last class of each day, per row"""
+    any_class = busy.any(axis=2)
+    first = busy.argmax(axis=2)
+    last = SLOTS_PER_DAY - 1 - busy[:, :, ::-1].argmax(axis=2)
+    gaps = (last - first + 1) - busy.sum(axis=2)
+    return np.where(any_class, gaps, 0).sum(axis=1)
+
+
+def max_consecutive(busy):
+    """Longest run of back-to-back classes in any day, per row"""
+    runs = np.cumsum(busy, axis=2)
+    # Subtract the run total reached at the last free period before each slot
+    resets = np.maximum.accumulate(np.where(busy, 0, runs), axis=2)
+    return (runs - resets).max(axis=(1, 2))
+
+
+def daily_load_spread(busy):
+    """Difference between the busiest and lightest day, per row"""
+    load = busy.sum(axis=2)
+    return load.max(axis=1) - load.min(axis=1)
+
+
+def weighted_percentiles(values, weights, percentiles):
+    """Percentiles of values where each value counts weights[i] times"""
+    order = np.argsort(values, kind="stable")
+    cumulative = np.cumsum(weights[order])
+    ranks = np.asarray(percentiles) / 100 * cumulative[-1]
+    positions = np.searchsorted(cumulative, ranks, side="left")
+    return values[order][np.minimum(positions, len(values) - 1)]
+
+
+def summarize(values, weights=None):
+    """Mean, max and percentiles of a metric, optionally weighted"""
+    if len(values) == 0:
+        return {}
+    if weights is None:
+        weights = np.ones(len(values), dtype=np.int64)
+
+    summary = {
+        "mean": round(float(np.average(values, weights=weights)), 2),
+        "max": float(values.max()),
+    }
+    for p, value in zip(PERCENTILES, weighted_percentiles(values, weights, PERCENTILES)):
+        summary[f"p{p}"] = float(value)
+    return summary
+
+
+def count_clashes(matrix):
+    """Number of (row, slot) cells holding more than one course"""
+    return int((matrix > 1).sum())
+
+
+def analyze(courses, faculty, students, rooms, assignment):
+    """
+    Compute timetable quality metrics from a solver assignment.
+    Takes the records from load_data.load_records() (or DataFrames
+    converted with to_dict("records")). Student metrics are computed per
+    cohort and weighted by cohort size. Invalid slots are reported with
+    the clashes; unknown courses, faculty and rooms are counted and left
+    out of the metrics.
+    """
+    matrices = occupancy_matrices(courses, faculty, students, rooms, assignment)
+    sizes = matrices["cohort_sizes"]
+    cohort_busy = by_day(matrices["cohorts"])
+    faculty_busy = by_day(matrices["faculty"])
+
+    # Only faculty with at least one class count towards teaching days
+    teaching = faculty_busy.any(axis=(1, 2))
+    teaching_days = faculty_busy.any(axis=2).sum(axis=1)[teaching]
+
+    utilization = (matrices["rooms"] > 0).sum(axis=1) / TOTAL_SLOTS * 100
+
+    return {
+        "students": int(sizes.sum()),
+        "cohorts": len(sizes),
+        "clashes": {
+            "cohort_slots": count_clashes(matrices["cohorts"]),
+            "students_affected": int(sizes[(matrices["cohorts"] > 1).any(axis=1)].sum()),
+            "faculty_slots": count_clashes(matrices["faculty"]),
+            "room_slots": count_clashes(matrices["rooms"]),
+            **matrices["invalid_slots"],
+        },
+        "unknown_references": matrices["unknown_references"],
+        "idle_gaps": summarize(idle_gaps(cohort_busy), sizes),
+        "max_consecutive_hours": summarize(max_consecutive(cohort_busy), sizes),
+        "daily_load_spread": summarize(daily_load_spread(cohort_busy), sizes),
+        "faculty_teaching_days": summarize(teaching_days),
+        "room_utilization_percent": summarize(np.round(utilization, 1)),
+    }
+
+
+def save_report(report, path):
+    """Write the report as JSON"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(report, f, indent=4)
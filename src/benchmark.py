@@ -0,0 +1,137 @@
+import os
+import subprocess
+import sys
+import time
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Modules each CLI subcommand imports on top of cli itself
+COMMAND_IMPORTS = {
+    "cli": [],
+    "check": ["load_data"],
+    "validate": ["validate"],
+    "render": ["timetable_build"],
+    "analyze": ["analytics"],
+    "solve": ["solver"],
+}
+
+REPEATS = 5
+
+# Generated instance for model build times: copies of the repo data
+BUILD_COPIES = 8
+BUILD_WORKERS = 4
+
+
+def import_time(modules):
+    """
+    Time importing cli plus the given modules in a fresh interpreter.
+    Returns the best of REPEATS runs, in seconds.
+    """
+    code = (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        f"import {', '.join(['cli'] + modules)}\n"
+        "print(time.perf_counter() - start)\n"
+    )
+    runs = []
+    for _ in range(REPEATS):
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=SRC_DIR, capture_output=True, text=True, check=True
+        )
+        runs.append(float(result.stdout))
+    return min(runs)
+
+
+def command_time(argv):
+    """Time a full CLI invocation in a fresh interpreter, in seconds"""
+    runs = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, os.path.join(SRC_DIR, "cli.py")] + argv,
+            capture_output=True, check=True
+        )
+        runs.append(time.perf_counter() - start)
+    return min(runs)
+
+
+def scaled_data(copies):
+    """
+    Generate a large instance from copies of the repo data, each with its
+    own courses, faculty, students and rooms.
+    """
+    import pandas as pd
+    from load_data import load_data
+
+    courses, faculty, students, rooms = load_data()
+    tables = [[], [], [], []]
+
+    for i in range(copies):
+        suffix = f"_{i}"
+        c = courses.copy()
+        c["course_id"] += suffix
+        c["faculty_id"] += suffix
+        f = faculty.copy()
+        f["faculty_id"] += suffix
+        s = students.copy()
+        s["courses"] = s["courses"].apply(lambda ids: [x + suffix for x in ids])
+        r = rooms.copy()
+        r["room_id"] += suffix
+        for table, frame in zip(tables, (c, f, s, r)):
+            table.append(frame)
+
+    return [pd.concat(table, ignore_index=True) for table in tables]
+
+
+def build_times(copies, workers):
+    """
+    Time the sequential and parallel model builds on a generated instance.
+    Wall-clock only: the parallel build can only win with at least as many
+    CPUs as workers.
+    Returns a dict of timings in seconds.
+    """
+    import constraints
+    import model_build
+
+    courses, faculty, students, rooms = scaled_data(copies)
+    lab_courses = set(courses[courses["type"] == "lab"]["course_id"])
+    conflicts = constraints.build_conflicts(students, courses)
+    args = (courses, rooms, conflicts, lab_courses, 48)
+
+    start = time.perf_counter()
+    model_build.build_model(*args, workers=1)
+    times = {"courses": len(courses), "sequential": time.perf_counter() - start}
+
+    if not model_build.parallel_supported():
+        return times
+
+    start = time.perf_counter()
+    model_build.build_model(*args, workers=workers)
+    times["parallel"] = time.perf_counter() - start
+
+    return times
+
+
+def main():
+    print("\n⏱️  Import time per subcommand (best of "
+          f"{REPEATS}, fresh interpreter)\n")
+    for command, modules in COMMAND_IMPORTS.items():
+        print(f"   • {command:<10} {import_time(modules) * 1000:8.1f} ms")
+
+    print("\n⏱️  End-to-end command time\n")
+    print(f"   • {'check':<10} {command_time(['check']) * 1000:8.1f} ms")
+
+    times = build_times(BUILD_COPIES, BUILD_WORKERS)
+    print(f"\n⏱️  Model build, {times['courses']} courses "
+          f"({os.cpu_count()} CPUs)\n")
+    print(f"   • {'workers=1':<22} {times['sequential']:8.2f} s")
+    if "parallel" not in times:
+        print("   • parallel build needs ortools <= 9.14, skipped")
+    else:
+        print(f"   • {f'workers={BUILD_WORKERS}':<22} {times['parallel']:8.2f} s")
+    print()
+
+
+if __name__ == "__main__":
+    main()
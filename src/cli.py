@@ -0,0 +1,158 @@
+import argparse
+import json
+import sys
+from paths import DATA_DIR, OUTPUT_PATH, output_file
+
+# Heavy modules (pandas, ortools, rich) are imported inside the commands
+# that need them, so quick commands start without paying for them.
+
+
+def cmd_check(args):
+    """Load the CSV data without pandas and report consistency problems"""
+    from load_data import load_records, check_data
+
+    courses, faculty, students, rooms = load_records(args.data_dir)
+    print(f"✅ Loaded {len(courses)} courses, {len(faculty)} faculty, "
+          f"{len(students)} students, {len(rooms)} rooms")
+
+    problems = check_data(courses, faculty, students, rooms)
+    for problem in problems:
+        print(f"   • {problem}")
+
+    if problems:
+        print(f"❌ {len(problems)} problem(s) found")
+        return 1
+
+    print("✅ Data is consistent")
+    return 0
+
+
+def cmd_solve(args):
+    """Generate the timetable with CP-SAT"""
+    import solver
+
+    timetable = solver.main(
+        workers=args.workers or None,
+        data_dir=args.data_dir,
+        output_path=args.output,
+        render=args.render,
+    )
+    return 0 if timetable is not None else 1
+
+
+def cmd_validate(args):
+    """Run every timetable check against a saved timetable"""
+    from validate import VALIDATORS
+
+    with open(args.output) as f:
+        timetable = json.load(f)
+
+    failed = 0
+    for validator in VALIDATORS:
+        try:
+            validator(timetable)
+            print(f"✅ {validator.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {validator.__name__}: {e}")
+
+    return 1 if failed else 0
+
+
+def cmd_render(args):
+    """Print a saved timetable to the terminal"""
+    import timetable_build
+
+    timetable_build.render(args.output)
+    return 0
+
+
+def cmd_analyze(args):
+    """Compute quality metrics and clash counts for a saved solver assignment"""
+    from load_data import load_records
+    import analytics
+
+    assignment_path = output_file("assignment.json", args.output)
+    try:
+        with open(assignment_path) as f:
+            assignment = json.load(f)
+    except FileNotFoundError:
+        print(f"❌ No solver assignment at {assignment_path}; run 'solve' first")
+        return 1
+
+    courses, faculty, students, rooms = load_records(args.data_dir)
+
+    report = analytics.analyze(courses, faculty, students, rooms, assignment)
+    report_path = output_file("report.json", args.output)
+    analytics.save_report(report, report_path)
+
+    print(json.dumps(report, indent=4))
+    print(f"📊 Quality report saved to: {report_path}")
+    counts = list(report["clashes"].values()) + list(report["unknown_references"].values())
+    return 1 if any(counts) else 0
+
+
+def build_parser():
+    """Build the argument parser with one subcommand per command"""
+    parser = argparse.ArgumentParser(
+        prog="timetable",
+        description="University timetable generator",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    data = argparse.ArgumentParser(add_help=False)
+    data.add_argument("--data-dir", default=DATA_DIR,
+                      help="directory containing the input CSV files")
+
+    output = argparse.ArgumentParser(add_help=False)
+    output.add_argument("--output", default=OUTPUT_PATH,
+                        help="path of the timetable JSON file")
+
+    check = subparsers.add_parser(
+        "check", parents=[data], help="load and check the input data"
+    )
+    check.set_defaults(func=cmd_check)
+
+    solve = subparsers.add_parser(
+        "solve", parents=[data, output], help="generate the timetable"
+    )
+    solve.add_argument("--workers", type=int, default=1,
+                       help="processes used to build the model; 0 uses one "
+                            "per CPU (default: 1, sequential). Parallel "
+                            "builds need ortools <= 9.14 and fall back to "
+                            "sequential with a warning otherwise")
+    solve.add_argument("--no-render", dest="render", action="store_false",
+                       help="don't print the timetable after solving")
+    solve.set_defaults(func=cmd_solve)
+
+    validate = subparsers.add_parser(
+        "validate", parents=[output], help="check a generated timetable"
+    )
+    validate.set_defaults(func=cmd_validate)
+
+    render = subparsers.add_parser(
+        "render", parents=[output], help="print a generated timetable"
+    )
+    render.set_defaults(func=cmd_render)
+
+    analyze = subparsers.add_parser(
+        "analyze", parents=[data],
+        help="report timetable quality and clashes for a generated timetable"
+    )
+    analyze.add_argument("--output", default=OUTPUT_PATH,
+                         help="path of the timetable JSON file; reads "
+                              "assignment.json and writes report.json in the "
+                              "same directory")
+    analyze.set_defaults(func=cmd_analyze)
+
+    return parser
+
+
+def main(argv=None):
+    """Entry point: run the selected subcommand and return its exit code"""
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
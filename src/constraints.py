@@ -41,7 +41,8 @@ def add_conflict_constraints(model, course_slots, conflict_pairs, lab_courses):
     Ensure conflicting courses are not scheduled at the same time.
     For labs, also ensure they don't conflict with the consecutive period.
     """
-    for c1, c2 in conflict_pairs:
+    # Sorted so the model is built in the same order on every run
+    for c1, c2 in sorted(conflict_pairs):
         if c1 not in course_slots or c2 not in course_slots:
             continue
 
@@ -59,23 +60,28 @@ def add_conflict_constraints(model, course_slots, conflict_pairs, lab_courses):
                     model.Add(s2 + 1 != s1)
 
 
-def add_room_constraints(model, course_slots, room_vars, total_slots, num_rooms):
+def add_room_constraints(model, course_slots, room_vars, total_slots, num_rooms,
+                         start=0, stop=None):
     """
     Prevent room conflicts: no two courses can use the same room at the same time.
     
     Uses conditional constraints:
     - If course1 and course2 are in the same slot, they must use different rooms
+
+    start/stop restrict course1 to a range of course positions, so the pairs
+    can be split across workers.
     """
     all_courses = list(course_slots.keys())
     
     # Check every pair of courses
-    for i, c1 in enumerate(all_courses):
+    for i in range(start, len(all_courses) if stop is None else stop):
+        c1 = all_courses[i]
         for c2 in all_courses[i+1:]:
             # For each time slot of c1 and each time slot of c2
             for slot1 in course_slots[c1]:
                 for slot2 in course_slots[c2]:
                     # Create boolean: are they in the same slot?
-                    same_slot = model.NewBoolVar(f'{c1}_{c2}_same_{id(slot1)}_{id(slot2)}')
+                    same_slot = model.NewBoolVar(f'{c1}_{c2}_same_{slot1.Index()}_{slot2.Index()}')
                     
                     # If same slot, enforce different rooms
                     model.Add(slot1 == slot2).OnlyEnforceIf(same_slot)
@@ -83,6 +89,20 @@ def add_room_constraints(model, course_slots, room_vars, total_slots, num_rooms)
                     model.Add(room_vars[c1] != room_vars[c2]).OnlyEnforceIf(same_slot)
 
 
+def count_room_constraint_vars(course_slots, start=0, stop=None):
+    """Number of variables add_room_constraints creates for the same range"""
+    sizes = [len(slots) for slots in course_slots.values()]
+    stop = len(sizes) if stop is None else stop
+
+    # Each course pairs with every later course: keep a running suffix sum
+    later = sum(sizes[start + 1:])
+    count = 0
+    for i in range(start, stop):
+        count += sizes[i] * later
+        later -= sizes[i + 1] if i + 1 < len(sizes) else 0
+    return count
+
+
 def add_fixed_slot_constraints(model, course_slots, courses):
     """
     Add constraints for fixed time slots:
@@ -101,7 +121,7 @@ def add_fixed_slot_constraints(model, course_slots, courses):
             model.Add(slot != MENTOR_HOUR_SLOT)
 
             # Period 8 constraint
-            remainder = model.NewIntVar(0, 7, f"{cid}_slot{id(slot)}_rem")
+            remainder = model.NewIntVar(0, 7, f"{cid}_slot{slot.Index()}_rem")
             model.AddModuloEquality(remainder, slot, 8)
 
             if course_type == "honours":
@@ -124,6 +144,11 @@ def add_fixed_slot_constraints(model, course_slots, courses):
                     model.Add(slot != oe_slot)
 
 
+def count_fixed_slot_vars(course_slots):
+    """Number of variables add_fixed_slot_constraints creates"""
+    return sum(len(slots) for slots in course_slots.values())
+
+
 def add_room_type_constraints(model, room_vars, courses, rooms):
     """
     Ensure room types match course types:
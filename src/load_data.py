@@ -1,14 +1,31 @@
-import pandas as pd
+import csv
 import os
+from paths import DATA_DIR
 
+# Expected columns of each CSV file
+SCHEMA = {
+    "courses": ["course_id", "name", "credits", "weekly_hours", "faculty_id", "type"],
+    "faculty": ["faculty_id", "name", "max_hours"],
+    "students": ["student_id", "name", "courses"],
+    "rooms": ["room_id", "type"],
+}
+INT_COLUMNS = {"credits", "weekly_hours", "max_hours"}
+COURSE_TYPES = {"theory", "lab", "honours"}
+ROOM_TYPES = {"lecture", "lab"}
 
-def load_data():
+
+def parse_courses(course_string):
+    """Parse a pipe-separated course list"""
+    return [x.strip() for x in course_string.split("|")]
+
+
+def load_data(data_dir=None):
     """Load all CSV data files from the data directory"""
-    # Get absolute path to the project root (parent of src/)
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(script_dir)
-    data_dir = os.path.join(project_root, "data")
-    
+    # pandas is only needed by the solver, keep it off the import path
+    import pandas as pd
+
+    data_dir = data_dir or DATA_DIR
+
     # Load all CSV files
     courses = pd.read_csv(os.path.join(data_dir, "courses.csv"))
     faculty = pd.read_csv(os.path.join(data_dir, "faculty.csv"))
@@ -16,9 +33,119 @@ def load_data():
     rooms = pd.read_csv(os.path.join(data_dir, "rooms.csv"))
 
     # Parse pipe-separated course lists for students
-    def parse_courses(course_string):
-        return [x.strip() for x in course_string.split("|")]
-
     students["courses"] = students["courses"].apply(parse_courses)
 
-    return courses, faculty, students, rooms
\ No newline at end of file
+    return courses, faculty, students, rooms
+
+
+def load_records(data_dir=None):
+    """
+    Load all CSV data files as lists of dicts, without pandas.
+    Same tables as load_data(), for commands that don't need the solver.
+    """
+    data_dir = data_dir or DATA_DIR
+    tables = []
+
+    for table, columns in SCHEMA.items():
+        path = os.path.join(data_dir, f"{table}.csv")
+        with open(path, newline="") as f:
+            reader = csv.DictReader(f)
+            missing = [c for c in columns if c not in (reader.fieldnames or [])]
+            if missing:
+                raise ValueError(f"{path} is missing columns: {', '.join(missing)}")
+
+            rows = []
+            for row in reader:
+                # Short rows leave None in missing fields, long rows add
+                # a None key: keep them as empty values for check_data()
+                row.pop(None, None)
+                for column in columns:
+                    if row[column] is None:
+                        row[column] = ""
+                for column in INT_COLUMNS.intersection(row):
+                    # Bad values are kept as is and reported by check_data()
+                    try:
+                        row[column] = int(row[column])
+                    except (TypeError, ValueError):
+                        pass
+                rows.append(row)
+
+        if table == "students":
+            for row in rows:
+                row["courses"] = parse_courses(row["courses"]) if row["courses"] else []
+        tables.append(rows)
+
+    return tuple(tables)
+
+
+def check_data(courses, faculty, students, rooms):
+    """
+    Check records from load_records() for consistency.
+    Returns a list of problems (empty if the data is valid):
+    - Missing fields (short rows or blank values)
+    - Non-integer credits / weekly_hours / max_hours
+    - Duplicate ids
+    - Unknown course / room types
+    - Courses taught by unknown faculty
+    - Students registered for unknown courses
+    - Missing room types needed by the courses
+    """
+    problems = []
+
+    for name, rows, key, table in [
+        ("course", courses, "course_id", "courses"),
+        ("faculty", faculty, "faculty_id", "faculty"),
+        ("student", students, "student_id", "students"),
+        ("room", rooms, "room_id", "rooms"),
+    ]:
+        seen = set()
+        for row in rows:
+            # Blank counts are reported as non-integer below
+            empty = [
+                c for c in SCHEMA[table]
+                if c not in INT_COLUMNS and row[c] in ("", [])
+            ]
+            if empty:
+                problems.append(
+                    f"{name.capitalize()} {row[key] or '?'} is missing "
+                    f"{', '.join(empty)}"
+                )
+            for column in sorted(INT_COLUMNS.intersection(row)):
+                if not isinstance(row[column], int):
+                    problems.append(
+                        f"{name.capitalize()} {row[key]} has non-integer "
+                        f"{column}: {row[column]!r}"
+                    )
+            if row[key] in seen:
+                problems.append(f"Duplicate {name} id {row[key]}")
+            seen.add(row[key])
+
+    faculty_ids = {row["faculty_id"] for row in faculty}
+    course_ids = {row["course_id"] for row in courses}
+
+    for row in courses:
+        if row["type"] and row["type"] not in COURSE_TYPES:
+            problems.append(f"Course {row['course_id']} has unknown type {row['type']}")
+        if row["faculty_id"] and row["faculty_id"] not in faculty_ids:
+            problems.append(
+                f"Course {row['course_id']} taught by unknown faculty {row['faculty_id']}"
+            )
+
+    for row in students:
+        for cid in row["courses"]:
+            if cid not in course_ids:
+                problems.append(
+                    f"Student {row['student_id']} registered for unknown course {cid}"
+                )
+
+    room_types = {row["type"] for row in rooms}
+    for row in rooms:
+        if row["type"] not in ROOM_TYPES:
+            problems.append(f"Room {row['room_id']} has unknown type {row['type']}")
+
+    # Labs need lab rooms, every other course type uses lecture rooms
+    needed = {"lab" if row["type"] == "lab" else "lecture" for row in courses}
+    for room_type in sorted(needed - room_types):
+        problems.append(f"No {room_type} rooms available")
+
+    return problems
@@ -0,0 +1,280 @@
+from ortools.sat.python import cp_model
+from ortools.sat import cp_model_pb2
+from google.protobuf import text_format
+from concurrent.futures import ProcessPoolExecutor
+import os
+import warnings
+import constraints
+
+
+# Constraint families, in the order they are added to the model
+FAMILIES = ["conflicts", "rooms", "fixed_slots", "room_types"]
+
+# Data shared by every part a worker process builds, set by init_worker()
+worker_data = None
+
+# Constraint kinds the families emit, mapped to the fields holding variable
+# references (plain indices or negated literals) and linear expressions
+REF_FIELDS = {
+    "linear": (["vars"], []),
+    "bool_or": (["literals"], []),
+    "bool_and": (["literals"], []),
+    "at_most_one": (["literals"], []),
+    "exactly_one": (["literals"], []),
+    "all_diff": ([], ["exprs"]),
+    "table": (["vars"], ["exprs"]),
+    "int_mod": ([], ["target", "exprs"]),
+    "int_div": ([], ["target", "exprs"]),
+    "int_prod": ([], ["target", "exprs"]),
+    "lin_max": ([], ["target", "exprs"]),
+}
+
+
+def create_variables(model, courses, lab_courses, num_rooms, total_slots):
+    """
+    Create slot and room variables for each course.
+    Variables are created in course order, so every model built from the
+    same data agrees on the index of each variable.
+    """
+    course_slots = {}  # Maps course_id to list of slot variables
+    room_vars = {}     # Maps course_id to room variable
+
+    for _, row in courses.iterrows():
+        cid = row["course_id"]
+        weekly_hours = row["weekly_hours"]
+
+        if cid in lab_courses:
+            # Labs: 2 consecutive periods, store only start slot
+            start = model.NewIntVar(0, total_slots - 2, f"{cid}_start")
+            course_slots[cid] = [start]
+        else:
+            # Regular courses: one slot per weekly hour
+            course_slots[cid] = [
+                model.NewIntVar(0, total_slots - 1, f"{cid}_h{i}")
+                for i in range(weekly_hours)
+            ]
+            # All slots for this course must be different
+            model.AddAllDifferent(course_slots[cid])
+
+        # Room assignment variable
+        room_vars[cid] = model.NewIntVar(0, num_rooms - 1, f"{cid}_room")
+
+    return course_slots, room_vars
+
+
+def add_family(family, model, course_slots, room_vars, courses, rooms,
+               conflicts, lab_courses, total_slots, start=0, stop=None):
+    """
+    Add one constraint family to the model.
+    start/stop select a range of courses for the rooms family.
+    """
+    if family == "conflicts":
+        constraints.add_conflict_constraints(
+            model, course_slots, conflicts, lab_courses
+        )
+    elif family == "rooms":
+        constraints.add_room_constraints(
+            model, course_slots, room_vars, total_slots, len(rooms),
+            start, stop
+        )
+    elif family == "fixed_slots":
+        constraints.add_fixed_slot_constraints(model, course_slots, courses)
+    elif family == "room_types":
+        constraints.add_room_type_constraints(model, room_vars, courses, rooms)
+    else:
+        raise ValueError(f"Unknown constraint family: {family}")
+
+
+def family_var_count(family, course_slots, start=0, stop=None):
+    """Number of variables add_family() creates for the same arguments"""
+    if family == "rooms":
+        return constraints.count_room_constraint_vars(course_slots, start, stop)
+    if family == "fixed_slots":
+        return constraints.count_fixed_slot_vars(course_slots)
+    return 0
+
+
+def parallel_supported():
+    """
+    Workers send their parts back as binary protobuf. The native
+    CpModelProto of ortools >= 9.15 has no binary form, and the text
+    format is slower to parse than building the model sequentially.
+    """
+    return hasattr(cp_model.CpModel().Proto(), "SerializeToString")
+
+
+def as_message(proto):
+    """
+    Return a CpModelProto as a protobuf message. ortools >= 9.15 wraps the
+    proto natively, and only converts through the text format.
+    """
+    if hasattr(proto, "SerializeToString"):
+        return proto
+    return text_format.Parse(str(proto), cp_model_pb2.CpModelProto())
+
+
+def split_rooms(course_slots, parts):
+    """
+    Split course positions into ranges holding about the same number of
+    room constraints, as (start, stop) pairs in course order.
+    """
+    sizes = [len(slots) for slots in course_slots.values()]
+    total = constraints.count_room_constraint_vars(course_slots)
+
+    ranges = []
+    start = 0
+    done = 0
+    later = sum(sizes[1:])
+    for i, size in enumerate(sizes):
+        done += size * later
+        later -= sizes[i + 1] if i + 1 < len(sizes) else 0
+        if done * parts >= total * (len(ranges) + 1) and len(ranges) < parts - 1:
+            ranges.append((start, i + 1))
+            start = i + 1
+
+    ranges.append((start, len(sizes)))
+    return ranges
+
+
+def plan_parts(course_slots, num_vars, workers):
+    """
+    List the parts to build, in merge order, as (family, start, stop,
+    offset) where offset is the final index of the first variable the
+    part creates. Offsets follow from the data alone, so workers can place
+    their variables without knowing what the other parts built.
+    """
+    parts = []
+    offset = num_vars
+
+    for family in FAMILIES:
+        ranges = split_rooms(course_slots, workers) if family == "rooms" else [(0, None)]
+        for start, stop in ranges:
+            parts.append((family, start, stop, offset))
+            offset += family_var_count(family, course_slots, start, stop)
+
+    return parts
+
+
+def init_worker(courses, rooms, conflicts, lab_courses, total_slots):
+    """Receive the input data once per worker process, not once per part"""
+    global worker_data
+    worker_data = (courses, rooms, conflicts, lab_courses, total_slots)
+
+
+def remap_refs(refs, num_vars, shift):
+    """Shift references to part variables in place, keeping literal negation"""
+    for i, ref in enumerate(refs):
+        if ref >= num_vars:
+            refs[i] = ref + shift
+        elif ref < -num_vars:
+            refs[i] = ref - shift
+
+
+def remap_constraint(constraint, num_vars, shift):
+    """Shift every reference to a part variable of a constraint in place"""
+    kind = constraint.WhichOneof("constraint")
+    if kind not in REF_FIELDS:
+        raise ValueError(f"Cannot merge '{kind}' constraints from a worker model")
+
+    remap_refs(constraint.enforcement_literal, num_vars, shift)
+
+    body = getattr(constraint, kind)
+    ref_fields, expr_fields = REF_FIELDS[kind]
+    for field in ref_fields:
+        remap_refs(getattr(body, field), num_vars, shift)
+    for field in expr_fields:
+        exprs = getattr(body, field)
+        # Singular expression fields (target) are handled like a list of one
+        for expr in (exprs if field == "exprs" else [exprs]):
+            remap_refs(expr.vars, num_vars, shift)
+
+
+def build_part(part):
+    """
+    Worker entry point: build one part in a fresh model and return the
+    variables and constraints it added, as binary protobuf.
+    The part's variables are remapped to their final indices here, so the
+    parent only has to append each part.
+    """
+    family, start, stop, offset = part
+    courses, rooms, conflicts, lab_courses, total_slots = worker_data
+
+    model = cp_model.CpModel()
+    course_slots, room_vars = create_variables(
+        model, courses, lab_courses, len(rooms), total_slots
+    )
+    num_vars = len(model.Proto().variables)
+    num_constraints = len(model.Proto().constraints)
+
+    add_family(family, model, course_slots, room_vars, courses, rooms,
+               conflicts, lab_courses, total_slots, start, stop)
+    proto = as_message(model.Proto())
+
+    expected = family_var_count(family, course_slots, start, stop)
+    if len(proto.variables) - num_vars != expected:
+        raise RuntimeError(
+            f"{family} created {len(proto.variables) - num_vars} variables, "
+            f"expected {expected}"
+        )
+
+    result = cp_model_pb2.CpModelProto()
+    result.variables.extend(proto.variables[num_vars:])
+    result.constraints.extend(proto.constraints[num_constraints:])
+
+    shift = offset - num_vars
+    if shift and expected:
+        for constraint in result.constraints:
+            remap_constraint(constraint, num_vars, shift)
+
+    return result.SerializeToString()
+
+
+def merge_parts(proto, parts):
+    """Append serialized parts from build_part(), in order, to a model proto"""
+    for data in parts:
+        proto.MergeFrom(cp_model_pb2.CpModelProto.FromString(data))
+
+
+def build_model(courses, rooms, conflicts, lab_courses, total_slots,
+                workers=1):
+    """
+    Build the full CP-SAT model.
+    workers=1 builds every family in this process. Otherwise the families,
+    with the rooms family split into one range per worker, are built in
+    worker processes (workers=None uses every CPU) and appended in order,
+    so the result is identical to the sequential build. Without binary
+    protobuf support (see parallel_supported) it warns and builds
+    sequentially.
+    """
+    workers = workers or os.cpu_count() or 1
+    model = cp_model.CpModel()
+    course_slots, room_vars = create_variables(
+        model, courses, lab_courses, len(rooms), total_slots
+    )
+
+    if workers != 1 and not parallel_supported():
+        warnings.warn(
+            "Parallel model build needs ortools <= 9.14 (binary CpModelProto); "
+            "building sequentially",
+            RuntimeWarning,
+        )
+        workers = 1
+
+    if workers == 1:
+        for family in FAMILIES:
+            add_family(family, model, course_slots, room_vars, courses,
+                       rooms, conflicts, lab_courses, total_slots)
+        return model, course_slots, room_vars
+
+    proto = model.Proto()
+    parts = plan_parts(course_slots, len(proto.variables), workers)
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=init_worker,
+        initargs=(courses, rooms, conflicts, lab_courses, total_slots),
+    ) as pool:
+        # map() yields results in submission order, keeping the merge deterministic
+        merge_parts(proto, pool.map(build_part, parts))
+
+    return model, course_slots, room_vars
@@ -0,0 +1,11 @@
+import os
+
+# Project root is the parent of src/
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(PROJECT_ROOT, "data")
+OUTPUT_PATH = os.path.join(PROJECT_ROOT, "output", "timetable.json")
+
+
+def output_file(name, output_path=None):
+    """Path of another output file stored next to the timetable JSON"""
+    return os.path.join(os.path.dirname(os.path.abspath(output_path or OUTPUT_PATH)), name)
@@ -1,10 +1,12 @@
 from ortools.sat.python import cp_model
 from load_data import load_data
 import constraints
+import model_build
+from paths import OUTPUT_PATH, output_file
+import analytics
 import json
 import os
 from collections import defaultdict
-import timetable_build
 
 
 # Time configuration
@@ -20,69 +22,37 @@ def slot_to_time(slot):
     return day, f"Period {period + 1}"
 
 
-def main():
+def main(workers=1, data_dir=None, output_path=None, render=True):
+    """
+    Generate the timetable.
+    workers: processes used to build the model (1 = build sequentially in
+    this process, None = one per CPU)
+    data_dir / output_path: override the default data and output locations
+    render: print the timetable to the terminal after saving it
+    Returns the timetable, or None if no solution was found.
+    """
     print("\n🚀 Starting Timetable Generation...\n")
     
     # Load data
-    courses, faculty, students, rooms = load_data()
+    courses, faculty, students, rooms = load_data(data_dir)
     print(f"✅ Loaded {len(courses)} courses, {len(faculty)} faculty, {len(students)} students")
     
-    # Initialize CP-SAT model
-    model = cp_model.CpModel()
-    
     # Identify lab courses
     lab_courses = set(courses[courses["type"] == "lab"]["course_id"])
     print(f"✅ Identified {len(lab_courses)} lab courses\n")
 
-    # Decision variables
-    course_slots = {}  # Maps course_id to list of slot variables
-    room_vars = {}     # Maps course_id to room variable
-
-    # Create slot and room variables for each course
-    for _, row in courses.iterrows():
-        cid = row["course_id"]
-        weekly_hours = row["weekly_hours"]
-
-        if cid in lab_courses:
-            # Labs: 2 consecutive periods, store only start slot
-            start = model.NewIntVar(0, TOTAL_SLOTS - 2, f"{cid}_start")
-            course_slots[cid] = [start]
-        else:
-            # Regular courses: one slot per weekly hour
-            course_slots[cid] = [
-                model.NewIntVar(0, TOTAL_SLOTS - 1, f"{cid}_h{i}")
-                for i in range(weekly_hours)
-            ]
-            # All slots for this course must be different
-            model.AddAllDifferent(course_slots[cid])
-
-        # Room assignment variable
-        room_vars[cid] = model.NewIntVar(0, len(rooms) - 1, f"{cid}_room")
-
     # Build conflict pairs
     print("🔧 Building constraints...")
     conflicts = constraints.build_conflicts(students, courses)
     print(f"   • {len(conflicts)} conflict pairs identified")
 
-    # Add all constraints
-    constraints.add_conflict_constraints(
-        model, course_slots, conflicts, lab_courses
+    # Build slot/room variables and all constraint families
+    model, course_slots, room_vars = model_build.build_model(
+        courses, rooms, conflicts, lab_courses, TOTAL_SLOTS, workers
     )
     print("   • Student & faculty conflicts added")
-
-    constraints.add_room_constraints(
-        model, course_slots, room_vars, TOTAL_SLOTS, len(rooms)
-    )
     print("   • Room conflict prevention added")
-
-    constraints.add_fixed_slot_constraints(
-        model, course_slots, courses
-    )
     print("   • Fixed slot constraints added (Mentor Hour, P8, Open Electives)")
-
-    constraints.add_room_type_constraints(
-        model, room_vars, courses, rooms
-    )
     print("   • Room type matching added\n")
 
     # Solve the model
@@ -98,12 +68,13 @@ def main():
         print(f"\n❌ No solution found!")
         print(f"   Status: {solver.StatusName(status)}")
         print("   Try relaxing some constraints or adding more rooms/time slots.\n")
-        return
+        return None
 
     print(f"✅ Solution found! (Status: {solver.StatusName(status)})\n")
 
     # Build timetable from solution
     timetable = defaultdict(dict)
+    assignment = {}  # Maps course_id to its slots and room, for analytics
 
     for cid in course_slots:
         # Get course details
@@ -116,6 +87,11 @@ def main():
         # Determine department from course ID (first 3 chars)
         dept = cid[:3]
 
+        assignment[cid] = {
+            "slots": [solver.Value(slot_var) for slot_var in course_slots[cid]],
+            "room": room_id
+        }
+
         # Add all scheduled slots to timetable
         for slot_var in course_slots[cid]:
             slot = solver.Value(slot_var)
@@ -141,19 +117,36 @@ def main():
                 }
 
     # Save to JSON file
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(script_dir)
-    output_dir = os.path.join(project_root, "output")
-    os.makedirs(output_dir, exist_ok=True)
-    
-    output_path = os.path.join(output_dir, "timetable.json")
+    output_path = output_path or OUTPUT_PATH
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+
     with open(output_path, "w") as f:
         json.dump(timetable, f, indent=4)
 
     print(f"💾 Timetable saved to: {output_path}\n")
+
+    assignment_path = output_file("assignment.json", output_path)
+    with open(assignment_path, "w") as f:
+        json.dump(assignment, f, indent=4)
+
+    # Quality analytics over the slot-occupancy matrices
+    report = analytics.analyze(
+        courses.to_dict("records"),
+        faculty.to_dict("records"),
+        students.to_dict("records"),
+        rooms.to_dict("records"),
+        assignment,
+    )
+    report_path = output_file("report.json", output_path)
+    analytics.save_report(report, report_path)
+    print(f"📊 Quality report saved to: {report_path}\n")
     
     # Render beautiful terminal output
-    timetable_build.render()
+    if render:
+        import timetable_build
+        timetable_build.render(output_path)
+
+    return timetable
 
 
 if __name__ == "__main__":
@@ -1,12 +1,19 @@
 import json
 import pytest
+import subprocess
 import sys
 import os
 
 # Add src directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from solver import main
+from solver import main, TOTAL_SLOTS
+from load_data import load_data, load_records, check_data
+from paths import DATA_DIR, OUTPUT_PATH, output_file
+import analytics
+import constraints
+import model_build
+from ortools.sat.python import cp_model
 from validate import (
     validate_slot_range,
     validate_lab_consecutive,
@@ -22,11 +29,7 @@ def run_solver():
     main()
     
     # Load the generated timetable
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(script_dir)
-    output_path = os.path.join(project_root, "output", "timetable.json")
-    
-    with open(output_path) as f:
+    with open(OUTPUT_PATH) as f:
         return json.load(f)
 
 
@@ -70,4 +73,249 @@ def test_mentor_hour_blocked():
 def test_open_elective_lock():
     """Test that open electives are in correct slots"""
     timetable = run_solver()
-    validate_open_elective_slots(timetable)
\ No newline at end of file
+    validate_open_elective_slots(timetable)
+
+
+def test_parallel_parts_match_sequential():
+    """Test that merging worker-built parts reproduces the sequential model"""
+    courses, faculty, students, rooms = load_data()
+    lab_courses = set(courses[courses["type"] == "lab"]["course_id"])
+    conflicts = constraints.build_conflicts(students, courses)
+    args = (courses, rooms, conflicts, lab_courses, TOTAL_SLOTS)
+
+    sequential = model_build.build_model(*args, workers=1)[0]
+
+    # Build the parts in this process, on either proto backend
+    base = cp_model.CpModel()
+    course_slots, _ = model_build.create_variables(
+        base, courses, lab_courses, len(rooms), TOTAL_SLOTS
+    )
+    merged = model_build.as_message(base.Proto())
+    model_build.init_worker(*args)
+    parts = model_build.plan_parts(course_slots, len(merged.variables), 3)
+    model_build.merge_parts(merged, map(model_build.build_part, parts))
+
+    assert merged == model_build.as_message(sequential.Proto())
+
+
+@pytest.mark.skipif(
+    not model_build.parallel_supported(),
+    reason="parallel build needs protobuf-backed ortools (<= 9.14)"
+)
+def test_parallel_build_matches_sequential():
+    """Test that the multi-process build reproduces the sequential model"""
+    courses, faculty, students, rooms = load_data()
+    lab_courses = set(courses[courses["type"] == "lab"]["course_id"])
+    conflicts = constraints.build_conflicts(students, courses)
+
+    sequential = model_build.build_model(
+        courses, rooms, conflicts, lab_courses, TOTAL_SLOTS, workers=1
+    )[0]
+    parallel = model_build.build_model(
+        courses, rooms, conflicts, lab_courses, TOTAL_SLOTS, workers=3
+    )[0]
+
+    assert parallel.Proto() == sequential.Proto()
+
+
+@pytest.mark.skipif(
+    model_build.parallel_supported(),
+    reason="only warns when the parallel build is unsupported"
+)
+def test_unsupported_parallel_build_warns():
+    """Test that workers > 1 warns instead of silently building sequentially"""
+    courses, faculty, students, rooms = load_data()
+    lab_courses = set(courses[courses["type"] == "lab"]["course_id"])
+    conflicts = constraints.build_conflicts(students, courses)
+
+    with pytest.warns(RuntimeWarning, match="ortools <= 9.14"):
+        model_build.build_model(
+            courses, rooms, conflicts, lab_courses, TOTAL_SLOTS, workers=2
+        )
+
+
+def test_family_var_counts():
+    """Test that precomputed variable counts match what each family creates"""
+    courses, faculty, students, rooms = load_data()
+    lab_courses = set(courses[courses["type"] == "lab"]["course_id"])
+    conflicts = constraints.build_conflicts(students, courses)
+
+    model = cp_model.CpModel()
+    course_slots, room_vars = model_build.create_variables(
+        model, courses, lab_courses, len(rooms), TOTAL_SLOTS
+    )
+    ranges = model_build.split_rooms(course_slots, 3)
+    assert ranges[0][0] == 0 and ranges[-1][1] == len(course_slots)
+
+    for family in model_build.FAMILIES:
+        for start, stop in (ranges if family == "rooms" else [(0, None)]):
+            before = len(model.Proto().variables)
+            model_build.add_family(
+                family, model, course_slots, room_vars, courses, rooms,
+                conflicts, lab_courses, TOTAL_SLOTS, start, stop
+            )
+            created = len(model.Proto().variables) - before
+            assert created == model_build.family_var_count(
+                family, course_slots, start, stop
+            )
+
+
+def test_records_match_pandas_loader():
+    """Test that the pandas-free loader reads the same data as load_data"""
+    records = load_records()
+    frames = load_data()
+
+    for rows, frame in zip(records, frames):
+        assert rows == frame.to_dict("records")
+
+    assert check_data(*records) == []
+
+
+def test_check_data_reports_problems():
+    """Test that broken references are reported"""
+    courses, faculty, students, rooms = load_records()
+    courses[0]["faculty_id"] = "F99"
+    students[0]["courses"].append("XYZ999")
+
+    problems = check_data(courses, faculty, students, rooms)
+    assert any("F99" in p for p in problems)
+    assert any("XYZ999" in p for p in problems)
+
+
+def test_check_data_reports_non_integer_fields(tmp_path):
+    """Test that blank or non-numeric counts are reported, not raised"""
+    for name in ("courses", "faculty", "students", "rooms"):
+        with open(os.path.join(DATA_DIR, f"{name}.csv"), newline="") as f:
+            text = f.read()
+        if name == "faculty":
+            text = text.replace("F01,Dr Rajesh Kumar,18", "F01,Dr Rajesh Kumar,")
+        (tmp_path / f"{name}.csv").write_text(text)
+
+    problems = check_data(*load_records(str(tmp_path)))
+    assert problems == ["Faculty F01 has non-integer max_hours: ''"]
+
+
+def test_check_data_reports_missing_fields(tmp_path):
+    """Test that short CSV rows are reported as missing fields, not raised"""
+    for name in ("courses", "faculty", "students", "rooms"):
+        with open(os.path.join(DATA_DIR, f"{name}.csv"), newline="") as f:
+            text = f.read()
+        if name == "students":
+            text = text.rstrip("\n") + "\nS99,Broken\n"
+        if name == "faculty":
+            text = text.rstrip("\n") + "\nF99\n"
+        (tmp_path / f"{name}.csv").write_text(text)
+
+    problems = check_data(*load_records(str(tmp_path)))
+    assert problems == [
+        "Faculty F99 is missing name",
+        "Faculty F99 has non-integer max_hours: ''",
+        "Student S99 is missing courses",
+    ]
+
+
+def test_quick_commands_skip_heavy_imports():
+    """Test that check/validate don't import pandas, ortools or rich"""
+    code = (
+        "import sys, cli, load_data, validate\n"
+        "print(','.join(m for m in ('pandas', 'ortools', 'rich') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_render_module_import_has_no_console():
+    """Test that importing timetable_build doesn't create a console"""
+    result = subprocess.run(
+        [sys.executable, "-c", "import timetable_build; print(timetable_build.console)"],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "None"
+
+
+def test_report_has_no_clashes():
+    """Test that the analytics report finds no student clashes or bad slots"""
+    run_solver()
+
+    with open(output_file("report.json")) as f:
+        report = json.load(f)
+
+    # Room constraints don't cover the second period of labs yet, so
+    # room_slots can be non-zero for a valid solution
+    assert report["students"] > 0
+    for kind in ("cohort_slots", "students_affected", "out_of_range_slots",
+                 "lab_day_spills"):
+        assert report["clashes"][kind] == 0, kind
+    assert not any(report["unknown_references"].values())
+
+
+def test_analytics_metrics_and_clashes():
+    """Test occupancy metrics and clash detection on a small assignment"""
+    courses = [
+        {"course_id": "A", "faculty_id": "F1", "type": "theory"},
+        {"course_id": "B", "faculty_id": "F1", "type": "theory"},
+        {"course_id": "L", "faculty_id": "F2", "type": "lab"},
+    ]
+    faculty = [{"faculty_id": "F1"}, {"faculty_id": "F2"}]
+    rooms = [{"room_id": "R1"}, {"room_id": "R2"}]
+    students = [
+        {"student_id": "S1", "courses": ["A", "L"]},
+        {"student_id": "S2", "courses": ["L", "A"]},
+        {"student_id": "S3", "courses": ["B"]},
+    ]
+    # Mon: A in P1, lab in P4-P5 -> 2 idle periods, runs of 1 and 2
+    assignment = {
+        "A": {"slots": [0], "room": "R1"},
+        "B": {"slots": [8], "room": "R1"},
+        "L": {"slots": [3], "room": "R2"},
+    }
+
+    report = analytics.analyze(courses, faculty, students, rooms, assignment)
+    assert report["students"] == 3
+    assert report["cohorts"] == 2
+    assert not any(report["clashes"].values())
+    assert report["idle_gaps"]["max"] == 2
+    assert report["max_consecutive_hours"]["max"] == 2
+    # Weighted by cohort size: two students with 2 gaps, one with none
+    assert report["idle_gaps"]["mean"] == round(4 / 3, 2)
+
+    # B moved onto A's slot: same faculty and same room
+    assignment["B"]["slots"] = [0]
+    report = analytics.analyze(courses, faculty, students, rooms, assignment)
+    assert report["clashes"]["faculty_slots"] == 1
+    assert report["clashes"]["room_slots"] == 1
+    assert report["clashes"]["cohort_slots"] == 0
+
+
+def test_analytics_counts_invalid_slots_and_references():
+    """Test that bad slots and unknown ids are counted, not raised or wrapped"""
+    courses = [
+        {"course_id": "A", "faculty_id": "F1", "type": "theory"},
+        {"course_id": "L", "faculty_id": "F9", "type": "lab"},
+        {"course_id": "M", "faculty_id": "F1", "type": "lab"},
+    ]
+    faculty = [{"faculty_id": "F1"}]
+    rooms = [{"room_id": "R1"}]
+    students = [{"student_id": "S1", "courses": ["A", "L", "X"]}]
+    # A: slot 47 is valid, -1 and 48 are not; L starts in Period 8 (Mon P8);
+    # M starts at slot 47, the last period of the week, in an unknown room
+    assignment = {
+        "A": {"slots": [-1, 47, 48], "room": "R1"},
+        "L": {"slots": [7], "room": "R1"},
+        "M": {"slots": [47], "room": "R9"},
+    }
+
+    occupancy, invalid = analytics.course_occupancy(courses, assignment)
+    assert invalid == {"out_of_range_slots": 2, "lab_day_spills": 2}
+    assert occupancy.sum(axis=1).tolist() == [1, 1, 1]
+    assert occupancy[1, 7] == 1 and occupancy[1, 8] == 0
+
+    report = analytics.analyze(courses, faculty, students, rooms, assignment)
+    assert report["clashes"]["out_of_range_slots"] == 2
+    assert report["clashes"]["lab_day_spills"] == 2
+    assert report["unknown_references"] == {"courses": 1, "faculty": 1, "rooms": 1}
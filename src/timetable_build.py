@@ -5,7 +5,7 @@ from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
-import os
+from paths import OUTPUT_PATH
 
 DAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
 PERIODS = [f"Period {i}" for i in range(1, 9)]
@@ -20,17 +20,21 @@ TIME_SLOTS = [
     "3:00-4:00"
 ]
 
-# Get path to output directory
-script_dir = os.path.dirname(os.path.abspath(__file__))
-project_root = os.path.dirname(script_dir)
-OUTPUT_PATH = Path(os.path.join(project_root, "output", "timetable.json"))
+# Created on first use, so importing this module doesn't set up a terminal
+console = None
 
-console = Console()
 
+def get_console():
+    """Return the shared Rich console, creating it on first use"""
+    global console
+    if console is None:
+        console = Console()
+    return console
 
-def load_timetable():
+
+def load_timetable(path=None):
     """Load timetable from JSON file"""
-    return json.loads(OUTPUT_PATH.read_text())
+    return json.loads(Path(path or OUTPUT_PATH).read_text())
 
 
 def get_cell_style(course_name):
@@ -71,6 +75,7 @@ def build_grid(dept_data):
 
 def print_department_table(dept, dept_data):
     """Print a beautiful Rich table for one department"""
+    console = get_console()
     
     # Department name mapping
     dept_names = {
@@ -135,6 +140,7 @@ def print_department_table(dept, dept_data):
 
 def print_legend():
     """Print a legend explaining the color coding"""
+    console = get_console()
     legend = Table(show_header=False, box=None, padding=(0, 2))
     legend.add_column(justify="left")
     
@@ -153,6 +159,7 @@ def print_legend():
 
 def print_statistics(timetable):
     """Print statistics about the generated timetable"""
+    console = get_console()
     stats = Table(show_header=False, box=None)
     stats.add_column("Stat", style="bold cyan", justify="right")
     stats.add_column("Value", style="bold white", justify="left")
@@ -176,9 +183,10 @@ def print_statistics(timetable):
     ))
 
 
-def render():
+def render(path=None):
     """Main rendering function - displays everything"""
-    timetable = load_timetable()
+    console = get_console()
+    timetable = load_timetable(path)
     
     # Print header
     console.print()
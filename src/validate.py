@@ -93,4 +93,15 @@ def validate_open_elective_slots(timetable):
                 
                 if "Open Elective" in course:
                     assert (day, period) in allowed, \
-                        f"Open Elective wrongly scheduled in {dept} {day} {period}"
\ No newline at end of file
+                        f"Open Elective wrongly scheduled in {dept} {day} {period}"
+
+
+# All timetable checks, in the order they are reported
+VALIDATORS = [
+    validate_slot_range,
+    validate_lab_consecutive,
+    validate_no_room_conflicts,
+    validate_honours_only_p8,
+    validate_mentor_hour_block,
+    validate_open_elective_slots,
+]
\ No newline at end of file